@@ -5,6 +5,7 @@ import tempfile
 import re
 from urllib.parse import urlparse, parse_qs
 import requests
+from sentence_segmentation import split_sentences, segment_transcript
 
 # Configure AssemblyAI API key
 aai.settings.api_key = st.session_state.get("ASSEMBLYAI_API_KEY", None)
@@ -40,12 +41,13 @@ def transcribe_audio(audio_file_path):
         if transcript.status == aai.TranscriptStatus.error:
             st.error(f"Transcription failed: {transcript.error}")
             return None
-        else:
-            return transcript.text
     except Exception as e:
         st.error(f"Transcription error: {str(e)}")
         return None
 
+    st.session_state.transcript_sentences = segment_transcript(transcript)
+    return transcript.text
+
 def transcribe_youtube(youtube_url):
     """Transcribe YouTube video using AssemblyAI API"""
     try:
@@ -56,16 +58,18 @@ def transcribe_youtube(youtube_url):
         if transcript.status == aai.TranscriptStatus.error:
             st.error(f"YouTube transcription failed: {transcript.error}")
             return None
-        else:
-            return transcript.text
     except Exception as e:
         st.error(f"YouTube transcription error: {str(e)}")
         return None
 
-def summarize_text(text):
+    st.session_state.transcript_sentences = segment_transcript(transcript)
+    return transcript.text
+
+def summarize_text(text, sentences=None):
     """Summarize text using extractive summarization"""
     try:
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
+        if sentences is None:
+            sentences = split_sentences(text)
         if len(sentences) > 4:
             # Take first, middle, and last sentences for better summary
             summary_sentences = [
@@ -74,9 +78,9 @@ def summarize_text(text):
                 sentences[len(sentences)//2],
                 sentences[-2] if len(sentences) > 2 else sentences[-1]
             ]
-            summary = '. '.join(summary_sentences) + '.'
+            summary = ' '.join(summary_sentences)
         elif len(sentences) > 1:
-            summary = '. '.join(sentences[:2]) + '.'
+            summary = ' '.join(sentences[:2])
         else:
             summary = text
         return summary
@@ -570,13 +574,17 @@ def process_text_content():
     """Process direct text input"""
     # For text input, use the text directly as transcription
     st.session_state.transcription = st.session_state.input_text
+    st.session_state.transcript_sentences = None
     continue_processing()
 
 def continue_processing():
     """Common processing steps after transcription"""
     # Step 2: Summarization
     with st.status("Summarizing content...", expanded=True) as status:
-        summary = summarize_text(st.session_state.transcription)
+        summary = summarize_text(
+            st.session_state.transcription,
+            st.session_state.get('transcript_sentences')
+        )
         st.session_state.summary = summary
         status.update(label="Summarization complete", state="complete")
     
@@ -0,0 +1,124 @@
+"""Rule-based sentence segmentation for plain text and AssemblyAI transcripts"""
+import re
+
+# Titles never end a sentence
+TITLE_ABBREVIATIONS = frozenset({
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "mt", "vs", "cf",
+    "e.g", "i.e", "vol", "fig", "dept", "univ", "gen", "col", "lt", "sgt",
+    "capt", "rev", "jan", "feb", "mar", "apr", "jun", "jul", "aug", "sep",
+    "sept", "oct", "nov", "dec",
+})
+# Usually followed by a name ("U.S. Army", "Acme Inc. Board"), so they only
+# end a sentence when a common sentence opener follows
+NAME_ABBREVIATIONS = frozenset({"u.s", "u.k", "inc", "co", "corp"})
+# End a sentence before any capitalised word that is not itself an
+# abbreviation or initial
+SENTENCE_FINAL_ABBREVIATIONS = frozenset({
+    "etc", "ltd", "al", "approx", "a.m", "p.m", "ph.d", "b.sc", "m.sc",
+})
+ABBREVIATIONS = TITLE_ABBREVIATIONS | NAME_ABBREVIATIONS | SENTENCE_FINAL_ABBREVIATIONS
+# Capitalised words that typically open a sentence
+SENTENCE_OPENERS = frozenset({
+    "i", "a", "an", "the", "this", "that", "these", "those", "there", "it",
+    "he", "she", "we", "they", "you", "my", "our", "his", "her", "their",
+    "its", "your", "but", "and", "so", "or", "yet", "then", "now", "if",
+    "when", "while", "after", "before", "in", "on", "at", "for", "as",
+    "however", "also", "what", "why", "how", "who", "where", "yes", "no",
+})
+# Gap between spoken words (in milliseconds) treated as a sentence break
+# when the transcript comes back without punctuation.
+SENTENCE_PAUSE_MS = 700
+
+# Candidate boundaries: terminal punctuation, optional closing quotes or
+# brackets, then whitespace or the end of the text. Decimals ("3.45") and
+# dotted words ("e.g", "example.com") never match.
+CANDIDATE_BOUNDARY_RE = re.compile(r'([.?!…]+)["\'”’)\]]*(?=\s|$)')
+NEXT_TOKEN_RE = re.compile(r'\s*(\S+)')
+OPENING_PUNCTUATION = '("\'“‘['
+# Longest abbreviation plus room for an opening bracket or quote
+PREVIOUS_TOKEN_WINDOW = max(map(len, ABBREVIATIONS)) + 2
+
+def is_initial(token):
+    """Check whether a token is a single uppercase letter followed by a period"""
+    return len(token) == 2 and token[1] == '.' and token[0].isupper()
+
+def is_abbreviation(token):
+    """Check whether a token is a known abbreviation followed by a period"""
+    return token.endswith('.') and token[:-1].lower() in ABBREVIATIONS
+
+def is_sentence_boundary(text, match):
+    """Check whether a candidate punctuation match ends a sentence"""
+    next_token = NEXT_TOKEN_RE.match(text, match.end())
+    if next_token is None:
+        return True
+    next_word = next_token.group(1).lstrip(OPENING_PUNCTUATION)
+    # A lowercase word or a digit continues the sentence ("Wait... and",
+    # "\"Why?\" she asked", "approx. 5")
+    if next_word[:1].islower() or next_word[:1].isdigit():
+        return False
+    if match.group(1) != '.':
+        return True
+
+    previous = text[max(0, match.start() - PREVIOUS_TOKEN_WINDOW):match.start()].split()
+    if not previous:
+        return True
+    word = previous[-1].lstrip(OPENING_PUNCTUATION)
+    lowered = word.lower()
+    opens_sentence = next_word.rstrip('.,;:!?').lower() in SENTENCE_OPENERS
+
+    if lowered in TITLE_ABBREVIATIONS:
+        return False
+    if lowered in NAME_ABBREVIATIONS:
+        return opens_sentence
+    if lowered in SENTENCE_FINAL_ABBREVIATIONS:
+        return not (is_initial(next_word) or is_abbreviation(next_word))
+    # The pronoun "I" ends a sentence unless more initials follow ("I. M. Pei")
+    if word == 'I':
+        return not is_initial(next_word)
+    # Middle initials ("John F. Kennedy") only end a sentence before a
+    # common opener ("Plan A. The next one")
+    if len(word) == 1 and word.isupper():
+        return opens_sentence
+    return True
+
+def sentence_ends(text):
+    """Yield the offset just past each sentence boundary in text"""
+    for match in CANDIDATE_BOUNDARY_RE.finditer(text):
+        if is_sentence_boundary(text, match):
+            yield match.end()
+
+def split_sentences(text):
+    """Split text into sentences, keeping terminal punctuation"""
+    sentences = []
+    start = 0
+    for end in sentence_ends(text):
+        sentence = text[start:end].strip()
+        if sentence:
+            sentences.append(sentence)
+        start = end
+    tail = text[start:].strip()
+    if tail:
+        sentences.append(tail)
+    return sentences
+
+def segment_transcript(transcript):
+    """Split an unpunctuated AssemblyAI transcript into sentences at speech pauses"""
+    text = transcript.text or ""
+    words = transcript.words or []
+    # Punctuated transcripts are left to split_sentences in summarize_text.
+    # Only real sentence ends count: "3.5", "Dr." or a URL do not.
+    if not words or next(sentence_ends(text), None) is not None:
+        return None
+
+    sentences = []
+    current = []
+    try:
+        for word, next_word in zip(words, words[1:] + [None]):
+            current.append(word.text)
+            if next_word is None or next_word.start - word.end >= SENTENCE_PAUSE_MS:
+                sentences.append(' '.join(current) + '.')
+                current = []
+    except (TypeError, AttributeError):
+        # Words without usable timestamps
+        return None
+    return sentences
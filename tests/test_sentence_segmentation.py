@@ -0,0 +1,68 @@
+from types import SimpleNamespace
+
+import pytest
+
+import sentence_segmentation
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("He owns many things, etc. The rest is history.",
+     ["He owns many things, etc.", "The rest is history."]),
+    ("I live in the U.S. They don't.", ["I live in the U.S.", "They don't."]),
+    ("We met at 5 p.m. Then we left.", ["We met at 5 p.m.", "Then we left."]),
+    ("Acme Inc. It is great.", ["Acme Inc.", "It is great."]),
+    ("Call me at 5 p.m. Dr. Smith will wait.", ["Call me at 5 p.m. Dr. Smith will wait."]),
+    ("Dr. Smith met Mr. J. K. Rowling at 3.45 p.m. yesterday. Was it fun? Yes!",
+     ["Dr. Smith met Mr. J. K. Rowling at 3.45 p.m. yesterday.", "Was it fun?", "Yes!"]),
+    ("See e.g. the notes. It cost approx. 5 dollars. \"Done.\" Next one... Fine.",
+     ["See e.g. the notes.", "It cost approx. 5 dollars.", "\"Done.\"", "Next one...", "Fine."]),
+    ("Plan A. The second plan failed.", ["Plan A.", "The second plan failed."]),
+    ("I am I. You are you.", ["I am I.", "You are you."]),
+    ("John F. Kennedy was president. He died.",
+     ["John F. Kennedy was president.", "He died."]),
+    ("George W. Bush spoke.", ["George W. Bush spoke."]),
+    ("I. M. Pei designed it.", ["I. M. Pei designed it."]),
+    ("The U.S. Army arrived.", ["The U.S. Army arrived."]),
+    ("He moved to the U.K. Parliament later.", ["He moved to the U.K. Parliament later."]),
+    ("Acme Inc. Board members voted.", ["Acme Inc. Board members voted."]),
+    ("Wait... and then it happened.", ["Wait... and then it happened."]),
+    ("\"Why?\" she asked. Nobody knew!", ["\"Why?\" she asked.", "Nobody knew!"]),
+    ("He said etc. Étienne agreed.", ["He said etc.", "Étienne agreed."]),
+    ("Dr. émile arrived late.", ["Dr. émile arrived late."]),
+    ("no punctuation at all", ["no punctuation at all"]),
+    ("", []),
+])
+def test_split_sentences(text, expected):
+    assert sentence_segmentation.split_sentences(text) == expected
+
+
+def word(text, start):
+    return SimpleNamespace(text=text, start=start, end=start + 200)
+
+
+def test_segment_transcript_splits_on_pauses():
+    words = [word("hello", 0), word("there", 300), word("how", 1500),
+             word("are", 1800), word("you", 2100)]
+    transcript = SimpleNamespace(text="hello there how are you", words=words)
+    assert sentence_segmentation.segment_transcript(transcript) == ["hello there.", "how are you."]
+
+
+def test_segment_transcript_ignores_non_terminal_periods():
+    words = [word("dr.", 0), word("smith", 300), word("paid", 600), word("3.5", 900),
+             word("dollars", 2000), word("see", 2300), word("example.com", 2600)]
+    transcript = SimpleNamespace(text="dr. smith paid 3.5 dollars see example.com", words=words)
+    assert sentence_segmentation.segment_transcript(transcript) == [
+        "dr. smith paid 3.5.", "dollars see example.com.",
+    ]
+
+
+@pytest.mark.parametrize("transcript", [
+    SimpleNamespace(text=None, words=None),
+    SimpleNamespace(text="Hello there. How are you?", words=[word("Hello", 0)]),
+    SimpleNamespace(text="hello there", words=[
+        SimpleNamespace(text="hello", start=None, end=None),
+        SimpleNamespace(text="there", start=None, end=None),
+    ]),
+])
+def test_segment_transcript_falls_back_to_none(transcript):
+    assert sentence_segmentation.segment_transcript(transcript) is None